@@ -35,16 +35,15 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urlparse, urlsplit, urlunsplit
+from functools import lru_cache
 from pathlib import Path
 from tqdm import tqdm
-from itertools import dropwhile
 import os, base64
 import json
 import pymupdf, ocrmypdf
-import logging
 
 # Local imports
 from transcribe_video import transcribe_video, combine_transcript
@@ -54,6 +53,7 @@ from utils import (
     ensure_directories,
     get_doc_size_bytes,
     get_highest_index,
+    open_master_pdf,
     ScraperError,
     DownloadError,
     ProcessingError,
@@ -66,11 +66,12 @@ config = load_config()
 logger = setup_logger(__name__, config)
 
 # Log startup information
-logger.info(f"PDF Scraper v{__version__} starting up")
+logger.info("PDF Scraper v%s starting up", __version__)
 
 # ─── GLOBAL VARIABLES ────────────────────────────────────────────────────────────────
 GLOBAL_DRIVER = None  # initialize driver
 WEBSITE_LINK = config["website"]["url"]
+VALID_STATUSES = frozenset(("PEND", "FAIL", "SUCC"))  # allowed urls.json statuses
 
 # ─── PATHS ────────────────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -87,6 +88,7 @@ MAX_MASTER_PDF_SIZE = (
 
 # ─── FILES ────────────────────────────────────────────────────────────────
 URLS_FILE = SCRIPT_DIR / config["files"]["urls"]
+URLS_SAVE_INTERVAL = config["files"]["urls_save_interval"]
 
 # ─── DIRECTORY SETUP ────────────────────────────────────────────────────────────────
 ensure_directories(
@@ -94,7 +96,7 @@ ensure_directories(
 )
 if not URLS_FILE.exists():
     URLS_FILE.touch()
-    logger.info(f"Created file: {URLS_FILE}")
+    logger.info("Created file: %s", URLS_FILE)
 
 
 # ─── DRIVER FUNCTIONS ────────────────────────────────────────────────────────────────
@@ -183,8 +185,7 @@ def get_links(website_url: str) -> dict:
 
     # First, collect all category links from the main page
     category_links = set()
-    for element in driver.find_elements(By.TAG_NAME, "a"):
-        href = element.get_attribute("href") or ""
+    for href in _get_hrefs(driver, "a"):
         if "category" in href and "subcategory" not in href:
             category_links.add(href)
 
@@ -210,24 +211,18 @@ def get_links(website_url: str) -> dict:
                 logger.info("Processing category: %s", category_name)
 
                 # Get all article links from this category's subcategories
-                article_elements = driver.find_elements(
-                    By.CSS_SELECTOR, "ul.article-links a"
-                )
-                for article_element in article_elements:
+                for href in _get_hrefs(driver, "ul.article-links a"):
                     try:
-                        href = article_element.get_attribute("href")
                         if not href or "subcategory" in href:
                             continue
 
-                        # Add new links or update existing ones
-                        if href not in saved_links:
+                        # Add new links only; registry keys are normalized, so the
+                        # raw href must be normalized before checking membership
+                        if _normalize_url(href) not in saved_links:
                             _add_url(
                                 saved_links, href, status="PEND", category=category_name
                             )
 
-                    except StaleElementReferenceException:
-                        logger.debug("Stale article element, skipping...")
-                        continue
                     except Exception as e:
                         logger.exception(
                             "Error processing article %s: %s", href, str(e)
@@ -268,21 +263,59 @@ def wait_for_page_ready(driver):
     except TimeoutException:
         pass
 
-    # 2) if images exist, wait for all to load
+    # 2) wait for all images to load; the check is trivially true when the page
+    # has none, so there's no need to fetch the image elements first
     try:
-        imgs = driver.find_elements(By.TAG_NAME, "img")
-        if imgs:
-            js = """
-                return Array.from(document.images)
-                            .every(img => img.complete && img.naturalWidth > 0);
-            """
-            wait.until(lambda d: d.execute_script(js))
+        js = """
+            return Array.from(document.images)
+                        .every(img => img.complete && img.naturalWidth > 0);
+        """
+        wait.until(lambda d: d.execute_script(js))
     except TimeoutException:
         pass
 
     return True
 
 
+def _get_hrefs(driver, css_selector: str) -> list:
+    """Returns the href of every element matching a CSS selector.
+
+    Reads all hrefs with a single script call instead of one WebDriver
+    get_attribute round trip per element.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance to use.
+        css_selector (str): CSS selector of the link elements.
+
+    Returns:
+        list: Resolved href of each matching element, "" where it has none.
+    """
+    js = """
+        return Array.from(document.querySelectorAll(arguments[0]),
+                          el => el.href || "");
+    """
+    return driver.execute_script(js, css_selector)
+
+
+def _get_video_sources(driver) -> list:
+    """Returns the src of every video source element on the current page.
+
+    Reads all sources with a single script call instead of one WebDriver
+    get_attribute round trip per element.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance to use.
+
+    Returns:
+        list: Resolved src of each video source, "" where it has none.
+    """
+    js = """
+        return Array.from(document.querySelectorAll("video source"),
+                          el => el.src || "");
+    """
+    return driver.execute_script(js)
+
+
 def download_pdfs(saved_links: dict) -> dict:
     """Downloads PDFs for all pending links and saves them to the dated directory.
 
@@ -298,100 +331,99 @@ def download_pdfs(saved_links: dict) -> dict:
     """
     driver = initialize_driver()
 
-    # Calculate total PDFs to download
-    total_pdfs = len(
-        [link for link, data in saved_links.items() if data["status"] not in {"SUCC"}]
-    )
+    # Select the links still to download once, instead of counting them and then
+    # re-checking every entry's status inside the loop
+    pending_links = [
+        (link, data) for link, data in saved_links.items() if data["status"] != "SUCC"
+    ]
+    total_pdfs = len(pending_links)
     processed_pdfs = 0
 
     with tqdm(
         total=total_pdfs, desc="Downloading PDFs", unit="pdf", position=0, leave=True
     ) as pbar:
-        for link, data in saved_links.items():
-            if data["status"] not in {"SUCC"}:
-                try:
-                    logger.info(f"Processing: {link}")
-                    driver.get(link)
-                    wait_for_page_ready(driver)
+        for link, data in pending_links:
+            try:
+                logger.info("Processing: %s", link)
+                driver.get(link)
+                wait_for_page_ready(driver)
 
-                    # Check if page has attachments and determine if it's a video
-                    try:
-                        # Find all video elements on the page
-                        video_elements = driver.find_elements(
-                            By.CSS_SELECTOR, "video source"
-                        )
-                        if video_elements:
-                            data["type"] = "mp4"
-                            data["video_urls"] = []  # Initialize list for video URLs
-                            for video_source in video_elements:
-                                video_url = video_source.get_attribute("src")
-                                if video_url:
-                                    logger.info(f"Found video in {link}: {video_url}")
-                                    data["video_urls"].append(
-                                        video_url
-                                    )  # Add each video URL to the list
-                                    # process mp4 types seperately after combining and categorizing PDFs to retain link to master_pdf,
-                                    # _process_transcripts in run_script
+                # Check if page has attachments and determine if it's a video
+                try:
+                    # Find all video elements on the page
+                    video_sources = _get_video_sources(driver)
+                    if video_sources:
+                        data["type"] = "mp4"
+                        data["video_urls"] = []  # Initialize list for video URLs
+                        for video_url in video_sources:
+                            if video_url:
+                                logger.info("Found video in %s: %s", link, video_url)
+                                data["video_urls"].append(
+                                    video_url
+                                )  # Add each video URL to the list
+                                # process mp4 types seperately after combining and categorizing PDFs to retain link to master_pdf,
+                                # _process_transcripts in run_script
 
-                    except Exception as e:
-                        logger.debug(
-                            "No videos found on page, proceeding with PDF processing"
-                        )
-                        pass
-
-                    # Process PDF
-                    pdf = driver.execute_cdp_cmd(
-                        "Page.printToPDF",
-                        {
-                            "printBackground": True,
-                            "paperWidth": 8.27,
-                            "paperHeight": 11.7,
-                        },
+                except Exception as e:
+                    logger.debug(
+                        "No videos found on page, proceeding with PDF processing"
                     )
-                    pdf_bytes = base64.b64decode(pdf["data"])
+                    pass
+
+                # Process PDF
+                pdf = driver.execute_cdp_cmd(
+                    "Page.printToPDF",
+                    {
+                        "printBackground": True,
+                        "paperWidth": 8.27,
+                        "paperHeight": 11.7,
+                    },
+                )
+                pdf_bytes = base64.b64decode(pdf["data"])
 
-                    if len(pdf_bytes) <= 2 * 1024:
-                        raise DownloadError(f"PDF too small for {link}")
+                if len(pdf_bytes) <= 2 * 1024:
+                    raise DownloadError(f"PDF too small for {link}")
 
-                    parse = urlparse(link)
-                    name = (parse.netloc + parse.path).strip("/").replace("/", "_")
-                    finalname = name + ".pdf"
+                parse = urlparse(link)
+                name = (parse.netloc + parse.path).strip("/").replace("/", "_")
+                finalname = name + ".pdf"
 
-                    try:
-                        with open(
-                            os.path.join(DATED_DOWNLOAD_DIR, finalname), "wb"
-                        ) as f:
-                            f.write(pdf_bytes)
-                        logger.info(
-                            "Saved as -> %s filesize: %s", finalname, len(pdf_bytes)
-                        )
-                        if (
-                            not data["type"] == "mp4"
-                        ):  # if not mp4, then we can set status to SUCC
-                            data["status"] = "SUCC"
-                    except IOError as e:
-                        raise DownloadError(f"Failed to save PDF {finalname}: {str(e)}")
-
-                except TimeoutException as e:
-                    logger.error("Timeout downloading %s: %s", link, str(e))
-                    data["status"] = "FAIL"
-                except DownloadError as e:
-                    logger.error("Download failed for %s: %s", link, str(e))
-                    data["status"] = "FAIL"
-                except ProcessingError as e:
-                    logger.error("Video processing failed for %s: %s", link, str(e))
-                    data["status"] = "FAIL"
-                except Exception as e:
-                    logger.exception(
-                        "Unexpected error downloading %s: %s", link, str(e)
+                try:
+                    with open(
+                        os.path.join(DATED_DOWNLOAD_DIR, finalname), "wb"
+                    ) as f:
+                        f.write(pdf_bytes)
+                    logger.info(
+                        "Saved as -> %s filesize: %s", finalname, len(pdf_bytes)
                     )
-                    data["status"] = "FAIL"
-                finally:
-                    _save_urls(saved_links)
+                    if (
+                        not data["type"] == "mp4"
+                    ):  # if not mp4, then we can set status to SUCC
+                        data["status"] = "SUCC"
+                except IOError as e:
+                    raise DownloadError(f"Failed to save PDF {finalname}: {str(e)}")
+
+            except TimeoutException as e:
+                logger.error("Timeout downloading %s: %s", link, str(e))
+                data["status"] = "FAIL"
+            except DownloadError as e:
+                logger.error("Download failed for %s: %s", link, str(e))
+                data["status"] = "FAIL"
+            except ProcessingError as e:
+                logger.error("Video processing failed for %s: %s", link, str(e))
+                data["status"] = "FAIL"
+            except Exception as e:
+                logger.exception(
+                    "Unexpected error downloading %s: %s", link, str(e)
+                )
+                data["status"] = "FAIL"
 
-                processed_pdfs += 1
-                pbar.update(1)
-                pbar.set_postfix({"Processed": f"{processed_pdfs}/{total_pdfs}"})
+            processed_pdfs += 1
+            # Persist progress in batches rather than rewriting urls.json per link
+            if processed_pdfs % URLS_SAVE_INTERVAL == 0:
+                _save_urls(saved_links)
+            pbar.update(1)
+            pbar.set_postfix({"Processed": f"{processed_pdfs}/{total_pdfs}"})
 
     _save_urls(saved_links)
     return saved_links
@@ -400,7 +432,7 @@ def download_pdfs(saved_links: dict) -> dict:
 # ─── PDF MANIPULATION ──────────────────────────────────────────────────────
 
 
-def _combine_categorize_pdfs() -> None:
+def _combine_categorize_pdfs(pdf_dict: dict = None) -> None:
     """Combines all PDFs from the dated download directory into master PDFs by category.
 
     This function:
@@ -410,6 +442,10 @@ def _combine_categorize_pdfs() -> None:
     4. Updates URL data with master PDF locations
     5. Splits master PDFs if they exceed size limit
 
+    Args:
+        pdf_dict (dict, optional): URL data already loaded by the caller, updated in
+            place. If None, it is loaded from the URLs file.
+
     Raises:
         ProcessingError: If PDF combination or categorization fails.
         ResourceNotFoundError: If required directories or files are missing.
@@ -430,65 +466,53 @@ def _combine_categorize_pdfs() -> None:
         pdf_files = sorted(DATED_DOWNLOAD_DIR.glob("*.pdf"))
         if not pdf_files:
             logger.exception(
-                f"No PDF files in {DATED_DOWNLOAD_DIR}, skipping combination and categorization"
+                "No PDF files in %s, skipping combination and categorization",
+                DATED_DOWNLOAD_DIR,
             )
             return
 
-        logger.info(f"Found {len(pdf_files)} PDF files to process")
+        logger.info("Found %s PDF files to process", len(pdf_files))
 
         # ----------------------------------------------------------------------
         # MATCH: Match PDFs with URL data
         # ----------------------------------------------------------------------
-        # Load URL data
-        pdf_dict = _load_urls()
+        # Load URL data unless the caller already holds it
+        if pdf_dict is None:
+            pdf_dict = _load_urls()
 
-        # Match PDFs with URLs in pdf_dict
+        # Match PDFs with URLs in pdf_dict and group them by category in the
+        # same pass, so each category doesn't rescan the whole registry
+        pdfs_by_category = {}
         for pdf_path in pdf_files:
-            # Convert filename to URL format
-            url_key = "https://" + pdf_path.stem.replace("_", "/")
+            # Convert filename to URL format, normalized the same way _add_url
+            # keys new entries
+            url_key = _normalize_url("https://" + pdf_path.stem.replace("_", "/"))
 
-            if url_key in pdf_dict:
-                pdf_dict[url_key]["path"] = pdf_path
-            else:
+            entry = pdf_dict.get(url_key)
+            if entry is None:
                 # Create a default entry with 'Unknown' category
                 _add_url(pdf_dict, url_key, status="SUCC", category="Unknown")
-                pdf_dict[url_key]["path"] = pdf_path
+                entry = pdf_dict[url_key]
+            entry["path"] = pdf_path
+
+            category = entry.get("category")
+            if category is not None:
+                pdfs_by_category.setdefault(category, []).append((pdf_path, entry))
 
         # ----------------------------------------------------------------------
         # CATEGORIES: Get unique categories from matched PDFs
         # ----------------------------------------------------------------------
-        # Get unique categories
-        unique_categories = set()
-        for url, data in pdf_dict.items():
-            if "category" in data:
-                unique_categories.add(data["category"])
-
-        logger.info(f"Found {len(unique_categories)} categories to process")
+        logger.info("Found %s categories to process", len(pdfs_by_category))
 
         # ----------------------------------------------------------------------
         # PROCESS: Process each category and create master PDFs
         # ----------------------------------------------------------------------
         # Process each category
-        for current_category in unique_categories:
-            logger.info(f"Processing category: {current_category}")
-
-            # Get PDFs for this category
-            category_pdfs = []
-            for url, data in pdf_dict.items():
-                if data.get("category") == current_category and "path" in data:
-                    # Only include PDFs from the current date's directory
-                    if (
-                        isinstance(data["path"], Path)
-                        and DATED_DOWNLOAD_DIR in data["path"].parents
-                    ):
-                        category_pdfs.append(data["path"])
-
-            if not category_pdfs:
-                logger.info(f"No PDFs found for category: {current_category}")
-                continue
+        for current_category, category_pdfs in pdfs_by_category.items():
+            logger.info("Processing category: %s", current_category)
 
             logger.debug(
-                f"Found {len(category_pdfs)} PDFs for category: {current_category}"
+                "Found %s PDFs for category: %s", len(category_pdfs), current_category
             )
 
             # ------------------------------------------------------------------
@@ -500,21 +524,20 @@ def _combine_categorize_pdfs() -> None:
 
             # Open or create master PDF
             master_path = MASTER_DIR / f"{current_category}_{current_index}.pdf"
-            if master_path.exists():
-                master_doc = pymupdf.open(str(master_path))
-                incremental = True
-            else:
-                logger.debug(f"Creating new master PDF: {master_path}")
-                master_doc = pymupdf.open()
-                master_doc.new_page()
-                incremental = False
+            master_doc, incremental = open_master_pdf(master_path)
+            if not incremental:
+                logger.debug("Creating new master PDF: %s", master_path)
+
+            # Track the master's size as a running total instead of re-serializing
+            # the whole (growing) master for every PDF added to it
+            master_size = get_doc_size_bytes(master_doc)
 
             try:
                 # --------------------------------------------------------------
                 # Add each PDF to the master document
                 # --------------------------------------------------------------
                 # Process each PDF in this category
-                for pdf_path in tqdm(
+                for pdf_path, entry in tqdm(
                     category_pdfs,
                     desc=f"Processing PDFs for {current_category}",
                     unit="pdf",
@@ -522,20 +545,17 @@ def _combine_categorize_pdfs() -> None:
                     leave=True,
                 ):
                     try:
-                        logger.debug(f"Processing {pdf_path.name}")
+                        logger.debug("Processing %s", pdf_path.name)
 
                         # Apply OCR as in the original code
                         chunk = apply_ocr(pymupdf.open(str(pdf_path)))
 
                         try:
                             # Check size limit
-                            if (
-                                get_doc_size_bytes(master_doc)
-                                + get_doc_size_bytes(chunk)
-                                > MAX_MASTER_PDF_SIZE
-                            ):
+                            chunk_size = get_doc_size_bytes(chunk)
+                            if master_size + chunk_size > MAX_MASTER_PDF_SIZE:
                                 logger.debug(
-                                    f"Size limit reached, creating new master PDF"
+                                    "Size limit reached, creating new master PDF"
                                 )
 
                                 # Save current and create new master
@@ -551,31 +571,34 @@ def _combine_categorize_pdfs() -> None:
                                     MASTER_DIR
                                     / f"{current_category}_{current_index}.pdf"
                                 )
-                                master_doc = pymupdf.open()
-                                master_doc.new_page()
-                                incremental = False
+                                master_doc, incremental = open_master_pdf(
+                                    master_path
+                                )
+                                master_size = get_doc_size_bytes(master_doc)
 
                             # Add PDF to master
                             page_offset = master_doc.page_count
                             master_doc.insert_pdf(chunk)
+                            master_size += chunk_size
 
                             # Record which pages in the master PDF this document occupies
-                            url_key = "https://" + pdf_path.stem.replace("_", "/")
-                            if url_key in pdf_dict:
-                                pdf_dict[url_key]["master_pdf"] = str(master_path)
-                                pdf_dict[url_key]["page_number"] = page_offset
+                            entry["master_pdf"] = str(master_path)
+                            entry["page_number"] = page_offset
                         finally:
                             chunk.close()
-                            _update_categories_file(current_category)
                     except Exception as e:
-                        logger.error(f"Error processing {pdf_path.name}: {str(e)}")
+                        logger.error("Error processing %s: %s", pdf_path.name, e)
 
                 # Save final master PDF
-                logger.debug(f"Saving master PDF: {master_path}")
+                logger.debug("Saving master PDF: %s", master_path)
                 master_doc.save(str(master_path), incremental=incremental, encryption=0)
             finally:
                 master_doc.close()
 
+            # Record the category once its master is written, rather than
+            # rewriting the same line to the categories file for every PDF
+            _update_categories_file(current_category)
+
         # ----------------------------------------------------------------------
         # FINALIZE: Save URL data and finish
         # ----------------------------------------------------------------------
@@ -588,7 +611,7 @@ def _combine_categorize_pdfs() -> None:
         raise ProcessingError(f"PDF processing failed: {str(e)}")
 
 
-def _process_transcripts() -> None:
+def _process_transcripts(pdf_dict: dict = None) -> None:
     """Processes video transcripts and combines them into master transcript PDFs.
 
     This function:
@@ -598,32 +621,38 @@ def _process_transcripts() -> None:
     4. Combines transcripts into master PDFs
     5. Updates URL data with transcript information
 
+    Args:
+        pdf_dict (dict, optional): URL data already loaded by the caller, updated in
+            place. If None, it is loaded from the URLs file.
+
     Raises:
         ProcessingError: If transcription or PDF creation fails.
     """
     # seperate method so we can retain link to master_pdf, page_number
-    pdf_dict = _load_urls()
+    if pdf_dict is None:
+        pdf_dict = _load_urls()
     for url, data in pdf_dict.items():
-        if data.get("type") == "mp4" and "video_urls" and not data["status"] == "SUCC":
-            video_urls = data["video_urls"]
+        if data.get("type") == "mp4" and data["status"] != "SUCC":
+            video_urls = data.get("video_urls", [])
             logger.debug(
-                f"Processing {len(video_urls)} video transcripts for page: {url}"
+                "Processing %s video transcripts for page: %s", len(video_urls), url
             )
             for video_url in video_urls:
-                logger.debug(f"Processing video transcript for: {video_url}")
+                logger.debug("Processing video transcript for: %s", video_url)
                 try:
                     transcript_doc = transcribe_video(
                         video_url,
                         category=data["category"],
                         master=data["master_pdf"],
                         master_page=data["page_number"],
+                        filename=Path(data["path"]).stem if data.get("path") else None,
                     )
                     combine_transcript(transcript_doc)
                 except Exception as e:
                     data["status"] = "FAIL"
                     raise ProcessingError(f"Transcription processing failed: {str(e)}")
 
-        data["status"] = "SUCC"
+            data["status"] = "SUCC"
     _save_urls(pdf_dict)
 
 
@@ -631,10 +660,12 @@ def apply_ocr(doc: pymupdf.Document) -> pymupdf.Document:
     """OCR a PyMuPDF Document object and return the OCRed version with searchable text.
 
     Args:
-        doc (pymupdf.Document): The document to apply OCR to.
+        doc (pymupdf.Document): The document to apply OCR to. It is closed when an
+            OCRed copy is returned in its place.
 
     Returns:
-        pymupdf.Document: OCRed version of the document.
+        pymupdf.Document: OCRed version of the document, or doc itself if OCR is
+            skipped.
 
     Raises:
         ProcessingError: If OCR processing fails.
@@ -644,17 +675,18 @@ def apply_ocr(doc: pymupdf.Document) -> pymupdf.Document:
 
     # Check if document has any images on any page
     image_count = 0
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        images = page.get_images(full=True)
-        image_count += len(images)
+    for page in doc:
+        # Only the count matters, so skip resolving each image's referencer
+        image_count += len(page.get_images())
         if image_count >= min_images:
             break  # to avoid unnecessary processing break after hitting the minimum
 
     # Skip OCR if less than 2 images found
     if image_count < min_images:
         logger.debug(
-            f"Less than {min_images} images found in document ({image_count} found), skipping OCR"
+            "Less than %s images found in document (%s found), skipping OCR",
+            min_images,
+            image_count,
         )
         return doc
 
@@ -673,23 +705,26 @@ def apply_ocr(doc: pymupdf.Document) -> pymupdf.Document:
         ocr_doc = pymupdf.open(stream=ocr_bytes, filetype="pdf")
         logger.info("OCR complete, returning new document")
 
+        # The caller only keeps the returned document, so release the original
+        doc.close()
+
         return ocr_doc
 
     except Exception as e:
-        logger.error(f"Error during OCR: {e}")
+        logger.error("Error during OCR: %s", e)
         raise ProcessingError(f"OCR processing failed: {str(e)}")
     finally:
         # Clean up temp files
-        if temp_input.exists():
-            temp_input.unlink()
-        if temp_output.exists():
-            temp_output.unlink()
+        temp_input.unlink(missing_ok=True)
+        temp_output.unlink(missing_ok=True)
 
 
-# TODO: Update urls.j
 def remove_pdf(pdf_key: str, delete_from_json: bool = False) -> None:
     """Removes a PDF from its master file and optionally from the URL database.
 
+    The page numbers of the PDFs that follow it in the same master are shifted
+    back so they keep pointing at their own pages.
+
     Args:
         pdf_key (str): The URL key of the PDF to remove.
         delete_from_json (bool, optional): Whether to delete the entry from urls.json.
@@ -710,39 +745,42 @@ def remove_pdf(pdf_key: str, delete_from_json: bool = False) -> None:
     data = pdf_dict[pdf_key]
     if data.get("master_pdf"):
         start_page = data["page_number"]
-        # create an iterator starting from the matching pdf_key (inclusive) to the end of pdf_dict
-        keys_iter = dropwhile(lambda x: x[0] != pdf_key, pdf_dict.items())
+        # The PDF ends right before the next PDF in the same master begins, i.e. the
+        # lowest page_number above start_page. Registry order (sorted by URL) says
+        # nothing about page order, so look at every entry of this master.
+        next_start_page = min(
+            (
+                entry["page_number"]
+                for entry in pdf_dict.values()
+                if entry.get("master_pdf") == data["master_pdf"]
+                and entry.get("page_number") is not None
+                and entry["page_number"] > start_page
+            ),
+            default=None,
+        )
 
         try:
             master_doc = pymupdf.open(str(data["master_pdf"]))
-            end_page = master_doc.page_count - 1
-            try:  # StopIteration is raised if there is no next pdf
-                next(keys_iter)  # skip the current pdf (pdf_key)
-                next_pdf_key = next(keys_iter)  # get the next pdf
-
-                while next_pdf_key[1].get("master_pdf") != data.get("master_pdf"):
-                    next_pdf_key = next(keys_iter)
-                    logger.debug(
-                        f"Next pdf_key contains different master_pdf: {next_pdf_key[1].get("master_pdf")}, skipping"
-                    )
-                    if (
-                        next_pdf_key[1].get("master_pdf") == data.get("master_pdf")
-                        and next_pdf_key[1].get("page_number") > start_page
-                    ):
-                        end_page = next_pdf_key[1]["page_number"] - 1
-                        break
-
-            except StopIteration:
-                # if no next pdf, use default end_page
-                pass
-
-            (end_page == master_doc.page_count) and logger.debug(
-                "pdf_key is last in master_file"
-            )
+            if next_start_page is None:
+                end_page = master_doc.page_count - 1
+                logger.debug("pdf_key is last in master_file")
+            else:
+                end_page = next_start_page - 1
 
             master_doc.delete_pages(start_page, end_page)
             master_doc.save(str(data["master_pdf"]), incremental=True, encryption=0)
 
+            # Shift every later PDF of this master back by the removed page count
+            # in one pass so their page_number still points at their first page
+            removed_pages = end_page - start_page + 1
+            for entry in pdf_dict.values():
+                if (
+                    entry.get("master_pdf") == data["master_pdf"]
+                    and entry.get("page_number") is not None
+                    and entry["page_number"] > start_page
+                ):
+                    entry["page_number"] -= removed_pages
+
         except ValueError as e:
             raise ValidationError(f"Invalid page range: {start_page} to {end_page}")
         except RuntimeError as e:
@@ -754,22 +792,30 @@ def remove_pdf(pdf_key: str, delete_from_json: bool = False) -> None:
         finally:
             master_doc.close()
 
+    master_pdf = data["master_pdf"]
     if delete_from_json:
         del pdf_dict[pdf_key]
-        logger.info(f"Deleted {pdf_key} from urls.json")
+        logger.info("Deleted %s from urls.json", pdf_key)
     else:
-        pdf_dict[pdf_key]["status"] = "PEND"
+        # The pages are gone from the master, so the entry no longer points into it
+        data["status"] = "PEND"
+        data["master_pdf"] = None
+        data["page_number"] = None
 
     _save_urls(pdf_dict)
-    logger.info(f"Deleted pages {start_page} to {end_page} from {data['master_pdf']}")
+    logger.info("Deleted pages %s to %s from %s", start_page, end_page, master_pdf)
 
 
 # ─── SAVING ────────────────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(raw_url: str) -> str:
     """Normalizes a URL by standardizing format and removing unnecessary components.
 
+    Results are cached since the same links are normalized repeatedly while
+    scraping, downloading and combining.
+
     Args:
         raw_url (str): The URL to normalize.
 
@@ -781,22 +827,25 @@ def _normalize_url(raw_url: str) -> str:
             - No trailing slash
             - No query parameters or fragments
     """
-    # components of url, urlparse seperates into 6 fields
-    parts = urlparse(raw_url, scheme="http")
+    # components of url, urlsplit seperates into 5 fields (no params field)
+    parts = urlsplit(raw_url, scheme="http")
     scheme = parts.scheme.lower()
     netloc = parts.netloc.lower()
-    path = (parts.path or "").lower()  # Safely handle None case
-    params = ""
-    query = ""
-    fragment = ""
+    path = parts.path.lower()
+    if ";" in path:  # drop ;params from the last segment, as urlparse would
+        head, sep, last = path.rpartition("/")
+        path = head + sep + last.split(";", 1)[0]
     if (
         path.endswith("/") and len(path) > 1
     ):  # remove ending (/), prevents duplicates if web developer is inconsistent with adding a (/) at the end of a link or not if it's the same link
         path = path[:-1]
 
-    # scheme://netloc/path;params?query#fragment
-    normalized = urlunparse((scheme, netloc, path, params, query, fragment))
-    return normalized
+    if not netloc:
+        # relative or scheme-only input, let urlunsplit handle the edge cases
+        return urlunsplit((scheme, netloc, path, "", ""))
+
+    # scheme://netloc/path
+    return f"{scheme}://{netloc}{path}"
 
 
 def _add_url(
@@ -820,7 +869,7 @@ def _add_url(
         ValidationError: If status is not valid.
     """
     status = status.upper()
-    if status not in {"PEND", "FAIL", "SUCC"}:
+    if status not in VALID_STATUSES:
         raise ValidationError("Status must be PEND, FAIL or SUCC")
     url = _normalize_url(raw_url)
     saved_links[url] = {
@@ -833,6 +882,23 @@ def _add_url(
     }
 
 
+def _json_default(obj):
+    """Converts values the json module can't serialize natively.
+
+    Args:
+        obj: Object the JSON encoder could not serialize.
+
+    Returns:
+        str: String form of a Path object.
+
+    Raises:
+        TypeError: If obj is not a Path.
+    """
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _save_urls(saved_links: dict) -> None:
     """Saves the saved_links dictionary to the URLs file in JSON format.
 
@@ -843,19 +909,13 @@ def _save_urls(saved_links: dict) -> None:
         OSError: If saving to file fails.
     """
     try:
-        # Convert Path objects to strings before saving to JSON
-        json_safe_links = {}
-        for url, data in saved_links.items():
-            json_safe_links[url] = data.copy()
-            if "path" in json_safe_links[url] and isinstance(
-                json_safe_links[url]["path"], Path
-            ):
-                json_safe_links[url]["path"] = str(json_safe_links[url]["path"])
-
+        # Path objects are converted by the encoder as it reaches them, instead of
+        # copying every entry up front
         with open(URLS_FILE, "w", encoding="utf8") as f:
-            json.dump(json_safe_links, f, indent=2, sort_keys=True)
+            json.dump(saved_links, f, indent=2, sort_keys=True, default=_json_default)
     except OSError as e:
         logger.error("Failed to save URLs to %s: %s", URLS_FILE, e)
+        raise  # Re-raise so callers don't carry on with unsaved progress
 
 
 def _load_urls() -> dict:
@@ -864,15 +924,14 @@ def _load_urls() -> dict:
     Returns:
         dict: Dictionary of URLs and their metadata. Empty dict if file doesn't exist.
     """
-    if (
-        not URLS_FILE.exists() or URLS_FILE.stat().st_size == 0
-    ):  # if empty, return blank set
-        return {}
     try:
         with open(URLS_FILE, "r", encoding="utf8") as f:
-            return json.load(f)
+            contents = f.read()
     except FileNotFoundError:
         return {}
+    if not contents:  # if empty, return blank set
+        return {}
+    return json.loads(contents)
 
 
 def _update_categories_file(updated_category: str) -> None:
@@ -892,10 +951,10 @@ def _update_categories_file(updated_category: str) -> None:
         with open(categories_file, "w", encoding="utf-8") as f:
             f.write(f"{updated_category} - updated\n")
 
-        logger.info(f"Updated categories file with category: {updated_category}")
+        logger.info("Updated categories file with category: %s", updated_category)
 
     except OSError as e:
-        logger.error(f"Error writing to categories file: {e}")
+        logger.error("Error writing to categories file: %s", e)
         raise  # Re-raise the OSError with its original traceback
 
 
@@ -915,9 +974,10 @@ def run_script():
     try:
         all_links = get_links(WEBSITE_LINK)
         print(f"INFO: Links found - {len(all_links)}")
+        # Hand the same registry through every stage instead of re-reading urls.json
         download_pdfs(all_links)
-        _combine_categorize_pdfs()
-        _process_transcripts()
+        _combine_categorize_pdfs(all_links)
+        _process_transcripts(all_links)
     except Exception as e:
         logger.exception("An error occurred while running the script: %s", str(e))
         raise ScraperError(f"Script execution failed: {str(e)}")
@@ -5,7 +5,13 @@ from pdf_scraper import (
     remove_pdf,
     _load_urls,
 )
-from utils import ValidationError, ResourceNotFoundError
+from utils import (
+    ValidationError,
+    ResourceNotFoundError,
+    get_highest_index,
+    open_master_pdf,
+)
+from pathlib import Path
 import pymupdf
 
 
@@ -98,6 +104,23 @@ class TestNormalizeURL:
         print(f"✅ Expected: {expected_result}")
         print(f"✅ Got: {actual_result}")
 
+    def test_strips_query_and_fragment(self):
+        """Test that _normalize_url drops query parameters and fragments.
+
+        Given: A URL with a query string and a fragment
+        When: _normalize_url is called
+        Then: Only the scheme, domain and path should remain
+        """
+        # ARRANGE: Set up our test data
+        input_url = "https://Example.com/Path/?page=2#top"
+        expected_result = "https://example.com/path"
+
+        # ACT: Call the function we're testing
+        actual_result = _normalize_url(input_url)
+
+        # ASSERT: Check if we got what we expected
+        assert actual_result == expected_result
+
 
 class TestAddURL:
     """Test cases for the _add_url function.
@@ -151,6 +174,101 @@ class TestAddURL:
         print(f"✅ Got expected error: {exc_result.value}")
 
 
+class TestGetHighestIndex:
+    """Test cases for the get_highest_index function.
+
+    The get_highest_index function should:
+    - Return the highest N among files named "{prefix}_N.pdf"
+    - Treat the prefix literally, even if it contains regex metacharacters
+    """
+
+    def test_returns_highest_index(self):
+        """Test that get_highest_index returns the largest matching index.
+
+        Given: Master PDF paths with indices 1, 3 and 2 plus an unrelated file
+        When: get_highest_index is called with the shared prefix
+        Then: 3 should be returned
+        """
+        # ARRANGE: Set up our test data
+        paths = [
+            Path("master_1.pdf"),
+            Path("master_3.pdf"),
+            Path("master_2.pdf"),
+            Path("other_9.pdf"),
+        ]
+
+        # ACT: Call the function we're testing
+        actual_result = get_highest_index(paths, "master")
+
+        # ASSERT: Check if we got what we expected
+        assert actual_result == 3
+
+    def test_prefix_with_regex_characters(self):
+        """Test that get_highest_index matches prefixes containing regex metacharacters.
+
+        Given: Master PDF paths for a category named "C++ (Legacy)"
+        When: get_highest_index is called with that category as prefix
+        Then: The highest index should be found instead of no match
+        """
+        # ARRANGE: Set up our test data
+        paths = [Path("C++ (Legacy)_1.pdf"), Path("C++ (Legacy)_2.pdf")]
+
+        # ACT: Call the function we're testing
+        actual_result = get_highest_index(paths, "C++ (Legacy)")
+
+        # ASSERT: Check if we got what we expected
+        assert actual_result == 2
+
+
+class TestOpenMasterPDF:
+    """Test cases for the open_master_pdf function.
+
+    The open_master_pdf function should:
+    - Create a new single-page document when the master doesn't exist
+    - Open the existing document for incremental saving when it does
+    """
+
+    def test_creates_new_master(self, tmp_path):
+        """Test that open_master_pdf creates a blank master when none exists.
+
+        Given: A master PDF path that doesn't exist yet
+        When: open_master_pdf is called
+        Then: A one-page document should be returned, not flagged as incremental
+        """
+        # ARRANGE: Set up our test data
+        master_path = tmp_path / "Guides_1.pdf"
+
+        # ACT: Call the function we're testing
+        master_doc, incremental = open_master_pdf(master_path)
+
+        # ASSERT: Check if we got what we expected
+        assert master_doc.page_count == 1
+        assert incremental is False
+        master_doc.close()
+
+    def test_opens_existing_master(self, tmp_path):
+        """Test that open_master_pdf opens an existing master incrementally.
+
+        Given: A saved two-page master PDF
+        When: open_master_pdf is called with its path
+        Then: The saved document should be returned, flagged as incremental
+        """
+        # ARRANGE: Set up our test data
+        master_path = tmp_path / "Guides_1.pdf"
+        with pymupdf.open() as doc:
+            doc.new_page()
+            doc.new_page()
+            doc.save(str(master_path))
+
+        # ACT: Call the function we're testing
+        master_doc, incremental = open_master_pdf(master_path)
+
+        # ASSERT: Check if we got what we expected
+        assert master_doc.page_count == 2
+        assert incremental is True
+        master_doc.close()
+
+
 class TestOCR:
     """Test cases for the apply_ocr function.
 
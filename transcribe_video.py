@@ -5,10 +5,10 @@
 
 
 import os
-import sys
 import tempfile
 import time
 from datetime import timedelta
+from functools import lru_cache
 import requests
 import whisper
 from tqdm import tqdm
@@ -22,6 +22,7 @@ from utils import (
     ensure_directories,
     get_doc_size_bytes,
     get_highest_index,
+    open_master_pdf,
     ProcessingError,
 )
 
@@ -39,16 +40,22 @@ MAX_MASTER_PDF_SIZE = (
 CHUNK_DURATION_MINUTES = config["transcript"]["chunk_duration_minutes"]
 WHISPER_MODEL = config["transcript"]["model"]
 
+# ─── GLOBAL VARIABLES ────────────────────────────────────────────────────────────────
+TRANSCRIPT_MASTER_INDEX = None  # resolved from TRANSCRIPT_MASTER_DIR on first use
+HTTP_SESSION = requests.Session()  # keeps connections alive between video downloads
+
 # ─── DIRECTORY SETUP ────────────────────────────────────────────────────────────────
 ensure_directories([TRANSCRIPT_MASTER_DIR])
 
 
-def download_video(url, output_path):
+def download_video(url, output_path, session=None):
     """Downloads a video from a direct URL to a local file.
 
     Args:
         url (str): The direct URL to the video file.
         output_path (str): Local path where the video should be saved.
+        session (requests.Session, optional): Session to download with. Defaults to
+            the module-level HTTP_SESSION so connections to the video host are reused.
 
     Returns:
         str: Path to the downloaded video file.
@@ -56,12 +63,13 @@ def download_video(url, output_path):
     Raises:
         requests.exceptions.RequestException: If video download fails.
     """
-    logger.info(f"Downloading video from {url}...")
-    response = requests.get(url, stream=True)
+    session = session or HTTP_SESSION
+    logger.info("Downloading video from %s...", url)
+    response = session.get(url, stream=True)
     response.raise_for_status()
 
     total_size = int(response.headers.get("content-length", 0))
-    block_size = 1024  # 1 Kibibyte
+    block_size = 1024 * 1024  # 1 Mebibyte, so large videos aren't written in tiny pieces
 
     with open(output_path, "wb") as file, tqdm(
         desc="Downloading",
@@ -74,7 +82,7 @@ def download_video(url, output_path):
             size = file.write(data)
             bar.update(size)
 
-    logger.debug(f"Video downloaded to {output_path}")
+    logger.debug("Video downloaded to %s", output_path)
     return output_path
 
 
@@ -95,7 +103,7 @@ def extract_audio(video_path, audio_path):
     video = VideoFileClip(video_path)
     video.audio.write_audiofile(audio_path, verbose=False, logger=None)
     video.close()
-    logger.debug(f"Audio extracted to {audio_path}")
+    logger.debug("Audio extracted to %s", audio_path)
     return audio_path
 
 
@@ -111,6 +119,20 @@ def format_timestamp(seconds):
     return str(timedelta(seconds=round(seconds)))
 
 
+@lru_cache(maxsize=2)
+def _load_whisper_model(model_name):
+    """Loads a Whisper model once and reuses it for every later transcription.
+
+    Args:
+        model_name (str): Name of the Whisper model to load (e.g. "base").
+
+    Returns:
+        whisper.model.Whisper: The loaded Whisper model.
+    """
+    logger.debug("Loading Whisper model (%s)...", model_name)
+    return whisper.load_model(model_name)
+
+
 def transcribe_audio(audio_path, chunk_duration=CHUNK_DURATION_MINUTES * 60):
     """Transcribes an audio file using OpenAI's Whisper model.
 
@@ -128,14 +150,13 @@ def transcribe_audio(audio_path, chunk_duration=CHUNK_DURATION_MINUTES * 60):
     Raises:
         ProcessingError: If transcription fails.
     """
-    logger.debug(f"Loading Whisper model ({WHISPER_MODEL})...")
-    model = whisper.load_model(WHISPER_MODEL)
+    model = _load_whisper_model(WHISPER_MODEL)
 
     logger.info("Starting transcription...")
     audio = whisper.load_audio(audio_path)
     audio_duration = len(audio) / whisper.audio.SAMPLE_RATE
 
-    logger.info(f"Audio duration: {format_timestamp(audio_duration)}")
+    logger.info("Audio duration: %s", format_timestamp(audio_duration))
 
     # Calculate the number of chunks
     chunk_size = chunk_duration * whisper.audio.SAMPLE_RATE
@@ -154,7 +175,11 @@ def transcribe_audio(audio_path, chunk_duration=CHUNK_DURATION_MINUTES * 60):
         end_time = end_sample / whisper.audio.SAMPLE_RATE
 
         logger.debug(
-            f"Transcribing chunk {i+1}/{num_chunks} [{format_timestamp(start_time)} - {format_timestamp(end_time)}]"
+            "Transcribing chunk %s/%s [%s - %s]",
+            i + 1,
+            num_chunks,
+            format_timestamp(start_time),
+            format_timestamp(end_time),
         )
 
         audio_chunk = audio[start_sample:end_sample]
@@ -169,6 +194,34 @@ def transcribe_audio(audio_path, chunk_duration=CHUNK_DURATION_MINUTES * 60):
     return full_transcript
 
 
+def _get_transcript_master_index():
+    """Returns the index of the transcript master PDF currently being filled.
+
+    The transcript master directory is only scanned on first use; afterwards the
+    cached index is returned and advanced by combine_transcript on rollover.
+
+    Returns:
+        int: Index of the current transcripts_master_N.pdf file.
+    """
+    global TRANSCRIPT_MASTER_INDEX
+    if TRANSCRIPT_MASTER_INDEX is None:
+        existing_masters = list(TRANSCRIPT_MASTER_DIR.glob("transcripts_master_*.pdf"))
+        TRANSCRIPT_MASTER_INDEX = (
+            get_highest_index(existing_masters, "transcripts_master") or 1
+        )
+    return TRANSCRIPT_MASTER_INDEX
+
+
+def _set_transcript_master_index(index):
+    """Records a new current transcript master index after a rollover.
+
+    Args:
+        index (int): Index of the newly created transcripts_master_N.pdf file.
+    """
+    global TRANSCRIPT_MASTER_INDEX
+    TRANSCRIPT_MASTER_INDEX = index
+
+
 def combine_transcript(transcript_doc: pymupdf.Document):
     """Combines a transcript document into master PDF files.
 
@@ -187,20 +240,14 @@ def combine_transcript(transcript_doc: pymupdf.Document):
         metadata = transcript_doc.metadata
         title = metadata.get("title", "Unknown")
 
-        # Find existing master PDFs
-        existing_masters = list(TRANSCRIPT_MASTER_DIR.glob("transcripts_master_*.pdf"))
-        current_index = get_highest_index(existing_masters, "transcripts_master") or 1
+        # Find current master PDF
+        current_index = _get_transcript_master_index()
 
         # Open or create master PDF
         master_path = TRANSCRIPT_MASTER_DIR / f"transcripts_master_{current_index}.pdf"
-        if master_path.exists():
-            master_doc = pymupdf.open(str(master_path))
-            incremental = True
-        else:
-            logger.debug(f"Creating new master PDF: {master_path}")
-            master_doc = pymupdf.open()
-            master_doc.new_page()
-            incremental = False
+        master_doc, incremental = open_master_pdf(master_path)
+        if not incremental:
+            logger.debug("Creating new master PDF: %s", master_path)
 
         try:
             # Check size limit
@@ -208,28 +255,29 @@ def combine_transcript(transcript_doc: pymupdf.Document):
                 get_doc_size_bytes(master_doc) + get_doc_size_bytes(transcript_doc)
                 > MAX_MASTER_PDF_SIZE
             ):
-                logger.debug(f"Size limit reached, creating new master PDF")
+                logger.debug("Size limit reached, creating new master PDF")
 
                 # Save current and create new master
                 master_doc.save(str(master_path), incremental=incremental, encryption=0)
                 master_doc.close()
 
                 current_index += 1
+                _set_transcript_master_index(current_index)
                 master_path = (
                     TRANSCRIPT_MASTER_DIR / f"transcripts_master_{current_index}.pdf"
                 )
-                master_doc = pymupdf.open()
-                master_doc.new_page()
-                incremental = False
+                master_doc, incremental = open_master_pdf(master_path)
 
             # Add transcript to master
             master_doc.insert_pdf(transcript_doc)
 
             # Save master PDF
-            logger.debug(f"Saving master PDF: {master_path}")
+            logger.debug("Saving master PDF: %s", master_path)
             master_doc.save(str(master_path), incremental=incremental, encryption=0)
 
-            logger.info(f"Added transcript '{title}' to master PDF {master_path.name}")
+            logger.info(
+                "Added transcript '%s' to master PDF %s", title, master_path.name
+            )
 
         finally:
             master_doc.close()
@@ -238,6 +286,20 @@ def combine_transcript(transcript_doc: pymupdf.Document):
         raise ProcessingError(f"Transcription combining failed: {str(e)}")
 
 
+def _format_segment(segment):
+    """Formats a transcribed segment as a single timestamped line.
+
+    Args:
+        segment (dict): Transcribed segment with 'start', 'end', and 'text' keys.
+
+    Returns:
+        str: The segment as "[start - end] text".
+    """
+    start_time = format_timestamp(segment["start"])
+    end_time = format_timestamp(segment["end"])
+    return f"[{start_time} - {end_time}] {segment['text']}"
+
+
 def save_transcript(transcript, output_file):
     """Saves a transcript to a text file in a readable format.
 
@@ -250,16 +312,18 @@ def save_transcript(transcript, output_file):
     """
     with open(output_file, "w", encoding="utf-8") as f:
         for segment in transcript:
-            start_time = format_timestamp(segment["start"])
-            end_time = format_timestamp(segment["end"])
-            text = segment["text"]
-            f.write(f"[{start_time} - {end_time}] {text}\n")
+            f.write(f"{_format_segment(segment)}\n")
 
-    logger.info(f"Transcript saved to {output_file}")
+    logger.info("Transcript saved to %s", output_file)
 
 
 def transcribe_video(
-    url, chunk_duration_minutes=10, category=None, master=None, master_page=None
+    url,
+    chunk_duration_minutes=10,
+    category=None,
+    master=None,
+    master_page=None,
+    filename=None,
 ):
     """Transcribes a video from a URL and creates a PDF document.
 
@@ -272,6 +336,8 @@ def transcribe_video(
         category (str, optional): Category of the video content. Defaults to None.
         master (str, optional): Path to master PDF source. Defaults to None.
         master_page (int, optional): Page number in master PDF. Defaults to None.
+        filename (str, optional): Name used for the transcript title. Defaults to None.
+            urls.json is only read when category or filename is not provided.
 
     Returns:
         pymupdf.Document: PDF document containing transcribed text and metadata.
@@ -281,21 +347,22 @@ def transcribe_video(
     """
     start_time = time.time()
 
-    # Load metadata from urls.json
-    metadata = {}
-    filename = "transcript"  # Default values
-    try:
-        with open("data/urls.json", "r") as f:
-            urls_data = json.load(f)
-            if url in urls_data:
-                metadata = urls_data[url]
-                # Use category from urls.json if not provided
-                if not category:
-                    category = metadata.get("category")
-                # Get filename from path in urls.json
-                filename = Path(metadata.get("path", "")).stem
-    except Exception as e:
-        logger.warning(f"Could not load metadata from urls.json: {e}")
+    # Load missing metadata from urls.json
+    if category is None or filename is None:
+        try:
+            with open("data/urls.json", "r") as f:
+                urls_data = json.load(f)
+                if url in urls_data:
+                    metadata = urls_data[url]
+                    # Use category from urls.json if not provided
+                    if not category:
+                        category = metadata.get("category")
+                    # Get filename from path in urls.json
+                    if filename is None:
+                        filename = Path(metadata.get("path", "")).stem
+        except Exception as e:
+            logger.warning("Could not load metadata from urls.json: %s", e)
+    filename = filename or "transcript"  # Default value
 
     # Create a temporary directory for files
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -313,10 +380,6 @@ def transcribe_video(
                 audio_path, chunk_duration=chunk_duration_minutes * 60
             )
 
-            # First save as text file (like the working version)
-            text_path = os.path.join(temp_dir, "transcript.txt")
-            save_transcript(transcript, text_path)
-
             # Create a new PDF document
             doc = pymupdf.open()
             page = doc.new_page()
@@ -324,10 +387,6 @@ def transcribe_video(
             # Add metadata to document
             doc.set_metadata({"title": filename, "subject": "Video Transcript"})
 
-            # Add title and metadata to first page
-            title_font = pymupdf.Font("helv")
-            text_font = pymupdf.Font("helv")
-
             # Add title
             page.insert_text((50, 50), f"Transcript: {filename}", fontsize=16)
 
@@ -346,27 +405,40 @@ def transcribe_video(
                 (50, y_pos), f"Master PDF Page Number: {master_page}", fontsize=12
             )
 
-            # Add transcript content from the text file
+            # Add transcript content straight from the segments
             y_pos += 40
-            with open(text_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    # Add text
-                    page.insert_text((50, y_pos), line.strip(), fontsize=12)
-                    y_pos += 20
+            lines = [_format_segment(segment).strip() for segment in transcript]
+
+            # Write each page's lines with a single insert_text call instead of
+            # one call (and one content stream update) per line
+            line_spacing = 20
+            start = 0
+            while start < len(lines):
+                # Lines fit while their baseline stays within 50pt of the bottom
+                lines_on_page = max(
+                    1, int((page.rect.height - 50 - y_pos) // line_spacing) + 1
+                )
+                page.insert_text(
+                    (50, y_pos),
+                    lines[start : start + lines_on_page],
+                    fontsize=12,
+                    lineheight=line_spacing / 12,
+                )
+                start += lines_on_page
 
-                    # Create new page if needed
-                    if y_pos > page.rect.height - 50:
-                        page = doc.new_page()
-                        y_pos = 50
+                # Create new page if needed
+                if start < len(lines):
+                    page = doc.new_page()
+                    y_pos = 50
 
             logger.info("Transcription completed successfully!")
             elapsed_time = time.time() - start_time
-            logger.debug(f"Total processing time: {format_timestamp(elapsed_time)}")
+            logger.debug("Total processing time: %s", format_timestamp(elapsed_time))
 
             return doc
 
         except Exception as e:
-            logger.error(f" {e}", file=sys.stderr)
+            logger.error("Video transcription failed: %s", e)
             raise ProcessingError(f"Video transcription failed: {str(e)}")
 
 
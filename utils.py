@@ -1,7 +1,8 @@
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import yaml
 from tqdm import tqdm
 import io
@@ -40,6 +41,7 @@ class ResourceNotFoundError(ScraperError):
 
 
 # ─── CONFIGURATION ──────────────────────────────────────────────────────────
+@lru_cache(maxsize=4)
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from config.yaml and sensitive_config.yaml files.
@@ -48,6 +50,9 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     and an optional sensitive config file. If a sensitive config exists, it will be
     merged into the main config under the 'sensitive' key.
 
+    Results are cached per config_path, so every module importing the config shares
+    one parsed copy. Treat the returned dictionary as read-only.
+
     Args:
         config_path (Optional[str]): Path to custom config file. If None, uses default location.
 
@@ -154,6 +159,11 @@ def setup_logger(
     else:
         logger.setLevel(getattr(logging, level))
 
+    # Re-running setup must not stack handlers, otherwise every record is
+    # formatted and written once per attached handler
+    if any(isinstance(h, TqdmLoggingHandler) for h in logger.handlers):
+        return logger
+
     # Create console handler with custom formatter
     console_handler = TqdmLoggingHandler()
     formatter = logging.Formatter(
@@ -189,7 +199,8 @@ def get_doc_size_bytes(doc: pymupdf.Document) -> int:
     """
     Calculate the total size of a PDF document in bytes.
 
-    Saves the document to a temporary buffer to calculate its size.
+    Unmodified documents opened from a file are measured by their size on disk.
+    Anything else is saved to a temporary buffer to calculate its size.
 
     Args:
         doc (pymupdf.Document): PyMuPDF Document object to measure.
@@ -202,11 +213,40 @@ def get_doc_size_bytes(doc: pymupdf.Document) -> int:
         >>> size = get_doc_size_bytes(doc)
         >>> print(f"Document size: {size} bytes")
     """
+    if doc.name and not doc.is_dirty:
+        return Path(doc.name).stat().st_size
+
     buf = io.BytesIO()
     doc.save(buf)
     return buf.tell()
 
 
+def open_master_pdf(master_path: Path) -> Tuple[pymupdf.Document, bool]:
+    """
+    Open an existing master PDF, or create a new one if it doesn't exist yet.
+
+    New master PDFs start with a single blank page so they can be saved before
+    any content is inserted.
+
+    Args:
+        master_path (Path): Path of the master PDF to open.
+
+    Returns:
+        Tuple[pymupdf.Document, bool]: The master document, and whether it already
+            existed on disk (and so should be saved incrementally).
+
+    Example:
+        >>> master_doc, incremental = open_master_pdf(Path("master/Guides_1.pdf"))
+        >>> master_doc.save("master/Guides_1.pdf", incremental=incremental)
+    """
+    if master_path.exists():
+        return pymupdf.open(str(master_path)), True
+
+    master_doc = pymupdf.open()
+    master_doc.new_page()
+    return master_doc, False
+
+
 def get_highest_index(paths: List[Path], prefix: str) -> int:
     """
     Find the highest index number from a list of PDF files with a given prefix.
@@ -226,9 +266,12 @@ def get_highest_index(paths: List[Path], prefix: str) -> int:
         >>> highest = get_highest_index(paths, "master")
         >>> print(highest)  # Output: 3
     """
+    # Compile once per call; escape the prefix since category names may contain
+    # regex metacharacters (e.g. "C++", "(Legacy)")
+    pattern = re.compile(rf"{re.escape(prefix)}_(\d+)\.pdf$")
     indices = []
     for p in paths:
-        m = re.search(rf"{prefix}_(\d+)\.pdf$", p.name)
+        m = pattern.search(p.name)
         if m:
             indices.append(int(m.group(1)))
     return max(indices) if indices else 0